@@ -1,65 +1,150 @@
+import collections
 import csv
+import heapq
 import json
+import operator
 import os
+import re
 import sys
 
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson is optional, the standard library's json module is used when it's not installed
+# (both for reading npm files and for writing the JSON output)
+try:
+   import orjson
+except ImportError:
+   orjson = None
+
+# ijson is optional, `package-lock.json` files are loaded whole when it's not installed
+try:
+   import ijson
+except ImportError:
+   ijson = None
+
+def load_json(file):
+   """Loads JSON data from the given file opened in binary mode, using `orjson` if it's installed."""
+   if orjson is not None:
+      return orjson.loads(file.read())
+
+   return json.load(file)
+
+def loads_json(data):
+   """Loads JSON data from the given bytes, using `orjson` if it's installed."""
+   if orjson is not None:
+      return orjson.loads(data)
+
+   return json.loads(data)
+
+def dumps_json(data):
+   """Serializes the given data to compact UTF-8 encoded JSON bytes, using `orjson` if it's installed."""
+   if orjson is not None:
+      return orjson.dumps(data)
+
+   return json.dumps(data, ensure_ascii = False, separators = (',', ':')).encode()
+
+# names of directories that aren't searched for git repositories, since they are large and never contain repositories of interest
+PRUNED_DIR_NAMES = {'node_modules', '.venv', '__pycache__'}
 
 def find_git_repo_paths(directory_path):
-   """Returns a list of all git repository paths inside a directory at the given path."""
-   git_repo_paths = []
+   """Returns a list of all git repository paths inside a directory at the given path.
 
-   for root, dirs, files in os.walk(directory_path):
-      if '.git' in dirs:
-         repo_path = os.path.abspath(root)
-         git_repo_paths.append(repo_path)
+   A directory is a git repository if it contains a `.git` directory, or a `.git` file as in worktrees and submodules.
+
+   Directories are not descended into once they are found to be git repositories, so nested repositories are not reported. Directories named in `PRUNED_DIR_NAMES` are not descended into either, and directories that can't be listed are skipped."""
+   git_repo_paths = []
+   dir_stack = [directory_path]
+
+   while dir_stack:
+      dir_path = dir_stack.pop()
+      subdir_paths = []
+      is_repo = False
+
+      # directories that can't be listed (for example because of missing permissions) are skipped, like `os.walk` does
+      try:
+         with os.scandir(dir_path) as entries:
+            for entry in entries:
+               # `.git` is a file (pointing to the actual git directory) in worktrees and submodules
+               if entry.name == '.git' and (entry.is_dir(follow_symlinks = False) or entry.is_file(follow_symlinks = False)):
+                  is_repo = True
+                  break
+
+               if entry.is_dir(follow_symlinks = False) and entry.name not in PRUNED_DIR_NAMES:
+                  subdir_paths.append(entry.path)
+      except OSError:
+         continue
+
+      if is_repo:
+         git_repo_paths.append(os.path.abspath(dir_path))
+      else:
+         dir_stack.extend(subdir_paths)
 
    return git_repo_paths
 
+# matches a `requirements.txt` line starting with `name==version`, the version ends at the first whitespace
+# (so trailing comments, environment markers and line continuations aren't included in it)
+PIP_LINE_PATTERN = re.compile(r'^([^=\s]+)==(\S+)', re.MULTILINE)
+
 def parse_pip(path):
    """Parses a `requirements.txt` file at the given path.
 
    Assumes that the `requirements.txt` file has no empty lines (except possibly one final empty line), and that each line is exactly of the form `name==version`.
+
+   The whole file is matched against `PIP_LINE_PATTERN` at once, and lines that don't match are counted and reported.
    
    Returns a dictionary with package name keys and package version values."""
-   deps = {}
-
    with open(path) as file:
-      for line in file:
-         line = line.rstrip()
-         item = line.split('==')
+      data = file.read()
 
-         if len(item) != 2:
-            print(f'Info: a line that doesn\'t satisfy the program\'s assumptions was found in {path}')
-            continue
+   matches = PIP_LINE_PATTERN.findall(data)
+   deps = dict(matches)
 
-         deps[item[0]] = item[1]
+   # the last line is counted separately if it isn't terminated by a newline
+   line_count = data.count('\n') + (data != '' and not data.endswith('\n'))
+
+   for _ in range(line_count - len(matches)):
+      print(f'Info: a line that doesn\'t satisfy the program\'s assumptions was found in {path}')
 
    return deps
 
-# list of keys that can contain dependencies in npm package.json and package-lock.json files
-DEPS_KEYS = ['dependencies', 'devDependencies', 'peerDependencies', 'optionalDependencies']
+def add_npm_deps(deps, data):
+   """Adds the dependencies found in the given npm package data (from a `package.json` file or a `package-lock.json` package entry) to the `deps` list as pairs (package name, package version).
+
+   The keys that can contain dependencies are `dependencies`, `devDependencies`, `peerDependencies` and `optionalDependencies`. They are read explicitly instead of in a loop, since this runs for every package in a `package-lock.json` file."""
+   data_get = data.get
+
+   deps_chunk = data_get('dependencies')
+   if deps_chunk:
+      deps.extend(deps_chunk.items())
+
+   deps_chunk = data_get('devDependencies')
+   if deps_chunk:
+      deps.extend(deps_chunk.items())
+
+   deps_chunk = data_get('peerDependencies')
+   if deps_chunk:
+      deps.extend(deps_chunk.items())
+
+   deps_chunk = data_get('optionalDependencies')
+   if deps_chunk:
+      deps.extend(deps_chunk.items())
 
 # package.json specification docs: https://docs.npmjs.com/cli/configuring-npm/package-json
 def parse_npm(path):
    """Parses a `package.json` file at the given path.
    
-   Assumes all the dependencies are contained within `DEPS_KEYS`.
+   Assumes all the dependencies are contained within the keys read by `add_npm_deps`.
 
    Versions are reported unmodified (in addition to single version numbers, they can also be ranges, URLs or paths).
    
    Returns a list of pairs (package name, package version)."""
    deps = []
 
-   with open(path) as file:
-      data = json.load(file)
-
-      for dep_key in DEPS_KEYS:
-         deps_chunk = data.get(dep_key)
-
-         if deps_chunk is not None:
-            for dep_name, dep_ver in deps_chunk.items():
-               deps.append((dep_name, dep_ver))
+   with open(path, 'rb') as file:
+      data = load_json(file)
+      add_npm_deps(deps, data)
 
    return deps
 
@@ -67,123 +152,357 @@ def parse_npm(path):
 def parse_npmlock(path):
    """Parses a `package-lock.json` file at the given path.
 
-   Assumes all the dependencies are contained within `DEPS_KEYS`.
+   Assumes all the dependencies are contained within the keys read by `add_npm_deps`.
 
-   Assumes that the `package-lock.json`'s `lockfileVersion` is at least `2` (`parse_npmlock` only parses the `packages` key, and not the legacy `dependencies` key).
+   Only supports a `lockfileVersion` of at least `2` (`parse_npmlock` only parses the `packages` key, and not the legacy `dependencies` key).
    
    Package names are reported unmodified (in addition to just the package name, they can also be full local paths).
 
    Versions are reported unmodified (in addition to single version numbers, they can also be ranges, URLs or paths).
 
-   Returns a list of pairs (package name, package version)."""
-   deps = []
+   The root package's dependencies are included, so `package.json` doesn't need to be parsed when the `package-lock.json` file exists.
 
-   with open(path) as file:
-      data = json.load(file)
+   If `ijson` is installed, the file is streamed one package at a time instead of being loaded whole.
 
-      packages_data = data.get('packages')
+   Returns a list of pairs (package name, package version), or `None` if the `lockfileVersion` is lower than `2`."""
+   deps = []
 
-      for pkg_name, pkg_data in packages_data.items():
+   with open(path, 'rb') as file:
+      if ijson is not None:
+         # `lockfileVersion` is at the start of the file, so only that part is parsed here
+         lockfile_version = next(ijson.items(file, 'lockfileVersion'), None)
+         file.seek(0)
+      else:
+         data = load_json(file)
+         lockfile_version = data.get('lockfileVersion')
+
+      # the legacy format (`lockfileVersion` 1) has no `packages` key
+      if lockfile_version is None or lockfile_version < 2:
+         print(f'Info: a `package-lock.json` file with an unsupported `lockfileVersion` was found in {path}')
+         return None
+
+      if ijson is not None:
+         packages_items = ijson.kvitems(file, 'packages')
+      else:
+         # like `ijson.kvitems`, a missing `packages` key yields no packages
+         packages_items = data.get('packages', {}).items()
+
+      for pkg_name, pkg_data in packages_items:
          if pkg_name == '':
-            # this data was already parsed in `parse_npm`
+            # the root package's entry mirrors `package.json`, so only its dependencies are reported
+            add_npm_deps(deps, pkg_data)
             continue
 
          pkg_ver = pkg_data.get('version')
          deps.append((pkg_name, pkg_ver))
+         add_npm_deps(deps, pkg_data)
 
-         for dep_key in DEPS_KEYS:
-            deps_chunk = pkg_data.get(dep_key)
+   return deps
 
-            if deps_chunk is not None:
-               for dep_name, dep_ver in deps_chunk.items():
-                  deps.append((dep_name, dep_ver))
+def dir_prefix(dir_path):
+   """Returns the given directory path ending with a path separator, so that paths inside the directory can be built by concatenation instead of `os.path.join`."""
+   if dir_path.endswith(os.sep) or (os.altsep is not None and dir_path.endswith(os.altsep)):
+      return dir_path
 
-   return deps
+   return dir_path + os.sep
+
+# matches a full SHA-1 (40 characters) or SHA-256 (64 characters) object hash
+HASH_PATTERN = re.compile(r'[0-9a-f]{40}(?:[0-9a-f]{24})?')
+
+class GitRepo:
+   """A git repository at the given path, used to resolve refs (such as `HEAD`) to object hashes.
+
+   Refs are resolved by reading the repository's files directly when possible: loose refs first, then `packed-refs`, following symbolic refs. Worktrees (where `.git` is a file pointing to the actual git directory) are supported.
+
+   Refs that can't be resolved from the files are resolved by a `git cat-file --batch-check` process, which is started on first use and then reused for all later lookups, so git's startup cost is paid at most once per repository.
+
+   Should be used as a context manager, so that the git process (if any) is stopped."""
+
+   def __init__(self, repo_path):
+      self.repo_path = repo_path
+      self.git_dir = dir_prefix(repo_path) + '.git'
+
+      if os.path.isfile(self.git_dir):
+         with open(self.git_dir) as file:
+            self.git_dir = os.path.join(repo_path, file.read().strip().removeprefix('gitdir: '))
+
+      # worktrees keep their own HEAD, but share refs with the main repository
+      self.common_dir = self.git_dir
+      commondir_path = dir_prefix(self.git_dir) + 'commondir'
+
+      if os.path.isfile(commondir_path):
+         with open(commondir_path) as file:
+            self.common_dir = os.path.join(self.git_dir, file.read().strip())
+
+      # paths inside the git directories are built by concatenating these prefixes, since every ref lookup needs them
+      self.git_dir_prefix = dir_prefix(self.git_dir)
+      self.common_dir_prefix = dir_prefix(self.common_dir)
+
+      self.batch_proc = None
+
+   def __enter__(self):
+      return self
+
+   def __exit__(self, exc_type, exc_value, traceback):
+      if self.batch_proc is not None:
+         self.batch_proc.stdin.close()
+         self.batch_proc.wait()
+
+   def resolve(self, ref):
+      """Returns the hash of the object the given ref (for example `HEAD` or `refs/heads/main`) points to.
+
+      Returns an empty string if the hash can't be determined (for example for `HEAD` in a repository without commits)."""
+      sha = self.read_ref(ref)
+
+      if sha is None:
+         sha = self.batch_resolve(ref)
+
+      return sha
+
+   def read_ref(self, ref):
+      """Resolves the given ref by reading the repository's files.
+
+      Only `HEAD`, other pseudo-refs like `ORIG_HEAD` and full ref names starting with `refs/` are looked up, since other names can be files in the git directory that aren't refs (such as `config`).
+
+      Returns `None` if the ref isn't found in the files or doesn't contain a valid hash."""
+      if not (ref.startswith('refs/') or (ref.endswith('HEAD') and ref.isupper())):
+         return None
+
+      for ref_dir_prefix in (self.git_dir_prefix, self.common_dir_prefix):
+         ref_path = ref_dir_prefix + ref
+
+         if os.path.isfile(ref_path):
+            with open(ref_path) as file:
+               content = file.read().strip()
+
+            if content.startswith('ref: '):
+               return self.read_ref(content.removeprefix('ref: '))
+
+            if HASH_PATTERN.fullmatch(content) is None:
+               return None
+
+            return content
+
+      packed_refs_path = self.common_dir_prefix + 'packed-refs'
+
+      if os.path.isfile(packed_refs_path):
+         with open(packed_refs_path) as file:
+            for line in file:
+               # skip the header and peeled tag lines
+               if line.startswith(('#', '^')):
+                  continue
+
+               sha, _, refname = line.rstrip().partition(' ')
+
+               if refname == ref and HASH_PATTERN.fullmatch(sha) is not None:
+                  return sha
+
+      return None
+
+   def batch_resolve(self, ref):
+      """Resolves the given ref using the repository's `git cat-file --batch-check` process, starting it if needed.
+
+      Returns an empty string if the ref doesn't exist or git can't be run or fails."""
+      # git exits early (with a nonzero exit code) if it can't read the repository, and there's no point in retrying
+      if self.batch_proc is not None and self.batch_proc.poll() is not None:
+         return ''
+
+      try:
+         if self.batch_proc is None:
+            command = ['git', '-C', self.repo_path, 'cat-file', '--batch-check']
+            self.batch_proc = subprocess.Popen(command, stdin = subprocess.PIPE, stdout = subprocess.PIPE, stderr = subprocess.DEVNULL, text = True)
+
+         self.batch_proc.stdin.write(ref + '\n')
+         self.batch_proc.stdin.flush()
+      except OSError:
+         return ''
+
+      line = self.batch_proc.stdout.readline()
+
+      if not line:
+         # git exited without answering
+         self.batch_proc.wait()
+         return ''
+
+      # the output is `<hash> <type> <size>` for existing objects and `<ref> missing` otherwise
+      output = line.split()
+
+      if len(output) != 3:
+         return ''
+
+      return output[0]
 
 def get_commit_hash(repo_path):
-   """Returns the latest commit's hash of the git repository at the given path."""
-   command = ['git', 'log', '--format=\"%H\"', '-n', '1']
-   proc = subprocess.run(command, cwd = repo_path, capture_output = True)
-   sha = proc.stdout.strip()[1:-1].decode()
+   """Returns the latest commit's hash of the git repository at the given path.
 
-   return sha
+   Returns an empty string if the hash can't be determined (for example in a repository without commits)."""
+   with GitRepo(repo_path) as repo:
+      return repo.resolve('HEAD')
 
-def create_sbom_entry(name, version, type, path, commit_hash):
-   """Creates a SBOM entry with the given values.
-   
-   The SBOM is a list of SBOM entry dictionaries. Creating SBOM entries using exclusively this method ensures a consistent structure.
-   
-   Returns the created SBOM entry dictionary."""
-   dep_d = {}
+# names of the SBOM fields, in the order they are stored and saved in
+SBOM_FIELDS = ('name', 'version', 'type', 'path', 'commit_hash')
 
-   dep_d['name'] = name
-   dep_d['version'] = version
-   dep_d['type'] = type
-   dep_d['path'] = path
-   dep_d['commit_hash'] = commit_hash
+def add_sbom_entries(sbom, deps, type, path, commit_hash):
+   """Adds SBOM entries for the given dependencies to the SBOM.
 
-   return dep_d
+   The SBOM is a tuple of parallel lists, one for each field in `SBOM_FIELDS`, so the i-th entry is made up of the i-th element of every list. Adding SBOM entries using exclusively this method keeps the lists the same length.
 
-if len(sys.argv) != 2:
-   print('Error: incorrect number of arguments.')
-   print(f'Usage: {sys.argv[0]} <directory>')
-   sys.exit(1)
+   `deps` is a collection of pairs (package name, package version), and the remaining values are shared by all the added entries."""
+   names, versions, types, paths, commit_hashes = sbom
 
-directory_path = sys.argv[1]
-git_repo_paths = find_git_repo_paths(directory_path)
+   for name, version in deps:
+      names.append(name)
+      versions.append(version)
 
-print(f'Found {len(git_repo_paths)} git repositories in \'{directory_path}\'')
+   count = len(deps)
+   types.extend([type] * count)
+   paths.extend([path] * count)
+   commit_hashes.extend([commit_hash] * count)
+
+def process_repo(repo_path):
+   """Finds all dependencies of the git repository at the given path.
 
-sbom = []
+   Returns the SBOM (in the format described in `add_sbom_entries`) containing only this repository's dependencies."""
+   sbom = tuple([] for _ in SBOM_FIELDS)
 
-# find all dependencies
-for repo_path in git_repo_paths:
-   commit_hash = get_commit_hash(repo_path)
+   # every entry of a repository references the same path and commit hash strings, and clones of the same repository share the commit hash
+   commit_hash = sys.intern(get_commit_hash(repo_path))
 
-   pip_path = os.path.join(repo_path, 'requirements.txt')
-   npm_path = os.path.join(repo_path, 'package.json')
+   # a single directory listing tells which of the dependency files exist
+   with os.scandir(repo_path) as entries:
+      repo_files = {entry.name: entry for entry in entries if entry.is_file()}
 
-   if os.path.exists(pip_path):
+   if 'requirements.txt' in repo_files:
+      pip_path = sys.intern(repo_files['requirements.txt'].path)
       pip_deps = parse_pip(pip_path)
+      add_sbom_entries(sbom, pip_deps.items(), 'pip', pip_path, commit_hash)
 
-      for dep in pip_deps:
-         sbom_entry = create_sbom_entry(dep, pip_deps[dep], 'pip', pip_path, commit_hash)
+   npmlock_deps = None
 
-         sbom.append(sbom_entry)
+   if 'package-lock.json' in repo_files:
+      npmlock_path = sys.intern(repo_files['package-lock.json'].path)
+      npmlock_deps = parse_npmlock(npmlock_path)
 
-   if os.path.exists(npm_path):
+   # a supported lock file contains all of the `package.json` dependencies, so `package.json` is only parsed without one
+   if npmlock_deps is not None:
+      add_sbom_entries(sbom, npmlock_deps, 'npm', npmlock_path, commit_hash)
+   elif 'package.json' in repo_files:
+      npm_path = sys.intern(repo_files['package.json'].path)
       npm_deps = parse_npm(npm_path)
+      add_sbom_entries(sbom, npm_deps, 'npm', npm_path, commit_hash)
 
-      for dep in npm_deps:
-         sbom_entry = create_sbom_entry(dep[0], dep[1], 'npm', npm_path, commit_hash)
+   return sbom
 
-         sbom.append(sbom_entry)
+def sbom_rows(sbom, order):
+   """Yields the SBOM entries at the given indices, in the given order.
 
-      npmlock_path = os.path.join(repo_path, 'package-lock.json')
+   Each entry is yielded as a tuple of field values in the order of `SBOM_FIELDS`."""
+   names, versions, types, paths, commit_hashes = sbom
 
-      if os.path.exists(npmlock_path):
-         npmlock_deps = parse_npmlock(npmlock_path)
+   for i in order:
+      yield (names[i], versions[i], types[i], paths[i], commit_hashes[i])
 
-         for dep in npmlock_deps:
-            sbom_entry = create_sbom_entry(dep[0], dep[1], 'npm', npmlock_path, commit_hash)
+# number of SBOM entries kept in memory before they are sorted and saved to a temporary file
+SBOM_CHUNK_SIZE = 200000
 
-            sbom.append(sbom_entry)
+def sorted_sbom_rows(sbom):
+   """Yields the SBOM entries sorted by name then version, as tuples of field values in the order of `SBOM_FIELDS`.
 
-# sort the SBOM by name then version
-sbom = sorted(sbom, key = lambda x: (x['name'], x['version']))
+   The entry indices are sorted instead of the entries themselves. The sort keys are built by zip, and the index in each key keeps equal entries in their original order."""
+   names, versions = sbom[0], sbom[1]
+   sort_keys = sorted(zip(names, versions, range(len(names))))
 
-# save the SBOM to .csv and .json files
-csv_path = os.path.join(directory_path, 'sbom.csv')
-json_path = os.path.join(directory_path, 'sbom.json')
+   return sbom_rows(sbom, [i for _, _, i in sort_keys])
+
+def save_sbom_run(sbom, path):
+   """Saves the SBOM entries, sorted by name then version, to a temporary file at the given path.
+
+   Each entry is saved as a JSON array on its own line, which (unlike CSV) keeps `None` values intact."""
+   with open(path, 'wb') as file:
+      for row in sorted_sbom_rows(sbom):
+         file.write(dumps_json(row) + b'\n')
+
+def load_sbom_run(path):
+   """Yields the SBOM entries saved by `save_sbom_run` at the given path, in the saved order."""
+   with open(path, 'rb') as file:
+      for line in file:
+         yield tuple(loads_json(line))
+
+def map_bounded(executor, fn, items, max_pending):
+   """Works like `executor.map(fn, items)`, but submits at most `max_pending` items ahead of the consumer.
+
+   `executor.map` submits all items at once, so finished results pile up in memory while the consumer is busy. Here, the next item is only submitted once a result is taken."""
+   pending = collections.deque()
+
+   for item in items:
+      if len(pending) >= max_pending:
+         yield pending.popleft().result()
 
-with open(csv_path, 'w', newline = '') as file:
-   wr = csv.DictWriter(file, sbom[0].keys())
-   wr.writeheader()
-   wr.writerows(sbom)
+      pending.append(executor.submit(fn, item))
 
-   print('Saved SBOM in CSV format to', csv_path)
+   while pending:
+      yield pending.popleft().result()
 
-with open(json_path, 'w') as file:
-   json.dump(sbom, file, indent = 3)
+if len(sys.argv) != 2:
+   print('Error: incorrect number of arguments.')
+   print(f'Usage: {sys.argv[0]} <directory>')
+   sys.exit(1)
+
+directory_path = sys.argv[1]
+git_repo_paths = find_git_repo_paths(directory_path)
+
+print(f'Found {len(git_repo_paths)} git repositories in \'{directory_path}\'')
+
+csv_path = os.path.join(directory_path, 'sbom.csv')
+json_path = os.path.join(directory_path, 'sbom.json')
 
-   print('Saved SBOM in CSV format to', json_path)
+sbom = tuple([] for _ in SBOM_FIELDS)
+run_paths = []
+
+with tempfile.TemporaryDirectory() as run_dir:
+   # find all dependencies, processing the repositories concurrently since the work is dominated by file I/O
+   # only a few repositories per worker are in flight, so that results don't pile up while chunks are being saved
+   max_workers = (os.cpu_count() or 1) * 4
+
+   with ThreadPoolExecutor(max_workers = max_workers) as executor:
+      for repo_sbom in map_bounded(executor, process_repo, git_repo_paths, max_workers * 2):
+         for field_values, repo_field_values in zip(sbom, repo_sbom):
+            field_values.extend(repo_field_values)
+
+         # bound the memory use by saving sorted chunks of the SBOM to temporary files
+         if len(sbom[0]) >= SBOM_CHUNK_SIZE:
+            run_path = os.path.join(run_dir, f'{len(run_paths)}.jsonl')
+            save_sbom_run(sbom, run_path)
+            run_paths.append(run_path)
+
+            sbom = tuple([] for _ in SBOM_FIELDS)
+
+   # merge the sorted chunks (the last one is still in memory) by name then version
+   # equal entries are taken from the earlier chunks first, so they keep their original order
+   sorted_runs = [load_sbom_run(run_path) for run_path in run_paths]
+   sorted_runs.append(sorted_sbom_rows(sbom))
+   rows = heapq.merge(*sorted_runs, key = operator.itemgetter(0, 1))
+
+   try:
+      # save the SBOM to .csv and .json files, writing each entry as soon as it's merged
+      with open(csv_path, 'w', newline = '') as csv_file, open(json_path, 'wb') as json_file:
+         wr = csv.writer(csv_file)
+         wr.writerow(SBOM_FIELDS)
+
+         # the JSON output is a list of objects, one per line
+         json_file.write(b'[')
+         separator = b'\n'
+
+         for row in rows:
+            wr.writerow(row)
+            json_file.write(separator + dumps_json(dict(zip(SBOM_FIELDS, row))))
+            separator = b',\n'
+
+         json_file.write(b'\n]\n')
+   finally:
+      # close the run files before the temporary directory is removed, even if the output fails (on Windows, open files can't be removed)
+      for sorted_run in sorted_runs:
+         sorted_run.close()
+
+print('Saved SBOM in CSV format to', csv_path)
+print('Saved SBOM in JSON format to', json_path)